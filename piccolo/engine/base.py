@@ -87,6 +87,15 @@ class Engine(t.Generic[TransactionClass], metaclass=ABCMeta):
     async def run_ddl(self, ddl: str, in_pool: bool = True):
         pass
 
+    async def run_ddls(
+        self, ddls: t.Sequence[str], in_pool: bool = True
+    ) -> t.List[t.Any]:
+        """
+        Run several DDL statements in order. Engines can override this to
+        run them all over a single connection.
+        """
+        return [await self.run_ddl(ddl, in_pool=in_pool) for ddl in ddls]
+
     @abstractmethod
     def transaction(self):
         pass
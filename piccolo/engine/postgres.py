@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import contextvars
 import typing as t
 from dataclasses import dataclass
@@ -207,11 +208,26 @@ class PostgresTransaction:
         return self
 
     async def get_connection(self):
-        if self.engine.pool:
+        shared_connection = self.engine.get_shared_connection()
+        if shared_connection:
+            return shared_connection.connection
+        elif self.engine.pool:
             return await self.engine.pool.acquire()
         else:
             return await self.engine.get_new_connection()
 
+    async def release_connection(self):
+        shared_connection = self.engine.get_shared_connection()
+        if shared_connection and shared_connection.connection is (
+            self.connection
+        ):
+            # The shared connection is released once it's finished with.
+            return
+        elif self.engine.pool:
+            await self.engine.pool.release(self.connection)
+        else:
+            await self.connection.close()
+
     async def begin(self):
         await self.transaction.start()
 
@@ -256,10 +272,7 @@ class PostgresTransaction:
             if not self._committed and not self._rolled_back:
                 await self.commit()
 
-        if self.engine.pool:
-            await self.engine.pool.release(self.connection)
-        else:
-            await self.connection.close()
+        await self.release_connection()
 
         self.engine.current_transaction.reset(self.context)
 
@@ -269,6 +282,65 @@ class PostgresTransaction:
 ###############################################################################
 
 
+class PostgresSharedConnection:
+    """
+    Used for running several queries over the same connection, using a
+    context manager. Unlike a transaction, each query is committed
+    immediately. Currently it's async only.
+
+    Usage::
+
+        async with engine.shared_connection():
+            # These queries all use the same connection:
+            await Band.select().run()
+            await Manager.select().run()
+
+    If a connection pool is running, the connection is acquired from it
+    once, rather than for each query.
+
+    A connection can only run one query at a time, so the connection is only
+    shared by queries running in the same asyncio task which entered the
+    block. Queries in other tasks (for example, those started with
+    ``asyncio.gather`` within the block) use the connection pool as usual.
+
+    """
+
+    __slots__ = ("engine", "connection", "context", "task", "_parent")
+
+    def __init__(self, engine: PostgresEngine):
+        self.engine = engine
+        self._parent: t.Optional[PostgresSharedConnection] = None
+
+    async def __aenter__(self) -> PostgresSharedConnection:
+        self._parent = self.engine.get_shared_connection()
+        if self._parent is not None:
+            return self._parent
+
+        self.task = asyncio.current_task()
+
+        if self.engine.pool:
+            self.connection = await self.engine.pool.acquire()
+        else:
+            self.connection = await self.engine.get_new_connection()
+
+        self.context = self.engine.current_shared_connection.set(self)
+        return self
+
+    async def __aexit__(self, exception_type, exception, traceback):
+        if self._parent is not None:
+            return
+
+        self.engine.current_shared_connection.reset(self.context)
+
+        if self.engine.pool:
+            await self.engine.pool.release(self.connection)
+        else:
+            await self.connection.close()
+
+
+###############################################################################
+
+
 class PostgresEngine(Engine[t.Optional[PostgresTransaction]]):
     """
     Used to connect to PostgreSQL.
@@ -336,6 +408,7 @@ class PostgresEngine(Engine[t.Optional[PostgresTransaction]]):
         "extra_nodes",
         "pool",
         "current_transaction",
+        "current_shared_connection",
     )
 
     engine_type = "postgres"
@@ -362,6 +435,11 @@ class PostgresEngine(Engine[t.Optional[PostgresTransaction]]):
         self.current_transaction = contextvars.ContextVar(
             f"pg_current_transaction_{database_name}", default=None
         )
+        self.current_shared_connection: contextvars.ContextVar[
+            t.Optional[PostgresSharedConnection]
+        ] = contextvars.ContextVar(
+            f"pg_current_shared_connection_{database_name}", default=None
+        )
         super().__init__()
 
     @staticmethod
@@ -531,10 +609,15 @@ class PostgresEngine(Engine[t.Optional[PostgresTransaction]]):
 
         # If running inside a transaction:
         current_transaction = self.current_transaction.get()
+        current_shared_connection = self.get_shared_connection()
         if current_transaction:
             response = await current_transaction.connection.fetch(
                 query, *query_args
             )
+        elif current_shared_connection:
+            response = await current_shared_connection.connection.fetch(
+                query, *query_args
+            )
         elif in_pool and self.pool:
             response = await self._run_in_pool(query, query_args)
         else:
@@ -553,8 +636,11 @@ class PostgresEngine(Engine[t.Optional[PostgresTransaction]]):
 
         # If running inside a transaction:
         current_transaction = self.current_transaction.get()
+        current_shared_connection = self.get_shared_connection()
         if current_transaction:
             response = await current_transaction.connection.fetch(ddl)
+        elif current_shared_connection:
+            response = await current_shared_connection.connection.fetch(ddl)
         elif in_pool and self.pool:
             response = await self._run_in_pool(ddl)
         else:
@@ -565,8 +651,71 @@ class PostgresEngine(Engine[t.Optional[PostgresTransaction]]):
 
         return response
 
+    async def _run_ddls_in_connection(
+        self, connection: Connection, ddls: t.Sequence[str]
+    ) -> t.List[t.Any]:
+        responses = []
+        for ddl in ddls:
+            query_id = self.get_query_id()
+
+            if self.log_queries:
+                self.print_query(query_id=query_id, query=ddl)
+
+            response = await connection.fetch(ddl)
+
+            if self.log_responses:
+                self.print_response(query_id=query_id, response=response)
+
+            responses.append(response)
+
+        return responses
+
+    async def run_ddls(
+        self, ddls: t.Sequence[str], in_pool: bool = True
+    ) -> t.List[t.Any]:
+        """
+        Run several DDL statements in order, over a single connection, rather
+        than acquiring a connection for each one. Each statement is still
+        committed as it's run, unless a transaction is active.
+        """
+        if self.current_transaction.get() or self.get_shared_connection():
+            # A connection is already available.
+            return await super().run_ddls(ddls, in_pool=in_pool)
+
+        if in_pool and self.pool:
+            async with self.pool.acquire() as connection:
+                return await self._run_ddls_in_connection(connection, ddls)
+
+        connection = await self.get_new_connection()
+        try:
+            return await self._run_ddls_in_connection(connection, ddls)
+        finally:
+            await connection.close()
+
     def atomic(self) -> Atomic:
         return Atomic(engine=self)
 
     def transaction(self, allow_nested: bool = True) -> PostgresTransaction:
         return PostgresTransaction(engine=self, allow_nested=allow_nested)
+
+    def get_shared_connection(self) -> t.Optional[PostgresSharedConnection]:
+        """
+        Returns the active shared connection, if it was created by the
+        current asyncio task. Tasks created within the
+        ``shared_connection`` block inherit the context variable, but can't
+        safely use the same connection concurrently.
+        """
+        shared_connection = self.current_shared_connection.get()
+        if (
+            shared_connection is not None
+            and shared_connection.task is asyncio.current_task()
+        ):
+            return shared_connection
+        return None
+
+    def shared_connection(self) -> PostgresSharedConnection:
+        """
+        Run several queries over the same connection. See
+        :class:`PostgresSharedConnection`.
+        """
+        return PostgresSharedConnection(engine=self)
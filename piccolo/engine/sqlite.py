@@ -699,6 +699,43 @@ class SQLiteEngine(Engine[t.Optional[SQLiteTransaction]]):
 
         return response
 
+    async def run_ddls(
+        self, ddls: t.Sequence[str], in_pool: bool = False
+    ) -> t.List[t.Any]:
+        """
+        Run several DDL statements in order, over a single connection, rather
+        than opening a connection for each one. Each statement is still
+        committed as it's run, unless a transaction is active.
+
+        Connection pools aren't currently supported - the argument is there
+        for consistency with other engines.
+        """
+        if self.current_transaction.get():
+            return await super().run_ddls(ddls, in_pool=in_pool)
+
+        responses = []
+
+        async with aiosqlite.connect(**self.connection_kwargs) as connection:
+            await connection.execute("PRAGMA foreign_keys = 1")
+
+            connection.row_factory = dict_factory  # type: ignore
+            for ddl in ddls:
+                query_id = self.get_query_id()
+
+                if self.log_queries:
+                    self.print_query(query_id=query_id, query=ddl)
+
+                async with connection.execute(ddl) as cursor:
+                    await connection.commit()
+                    response = await cursor.fetchall()
+
+                if self.log_responses:
+                    self.print_response(query_id=query_id, response=response)
+
+                responses.append(response)
+
+        return responses
+
     def atomic(
         self, transaction_type: TransactionType = TransactionType.deferred
     ) -> Atomic:
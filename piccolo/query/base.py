@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import functools
 import typing as t
-from time import time
+from time import perf_counter_ns
 
 from piccolo.columns.column_types import JSON, JSONB
 from piccolo.custom_types import QueryResponseType, TableInstance
 from piccolo.query.mixins import ColumnsDelegate
 from piccolo.querystring import QueryString
 from piccolo.utils.encoding import load_json
-from piccolo.utils.objects import make_nested_object
+from piccolo.utils.objects import make_nested_object, make_objects
 from piccolo.utils.sync import run_sync
 
 if t.TYPE_CHECKING:  # pragma: no cover
@@ -16,17 +17,40 @@ if t.TYPE_CHECKING:  # pragma: no cover
     from piccolo.table import Table  # noqa
 
 
+@functools.lru_cache(maxsize=1024)
+def _translate_keys(keys: t.Tuple[str, ...]) -> t.Optional[t.Tuple[str, ...]]:
+    """
+    Columns from joined tables are returned by the database with a ``$`` in
+    their names, which we replace with a ``.``. The same keys are returned
+    each time a query is run, so the result is cached.
+
+    :returns:
+        ``None`` if none of the keys need translating.
+
+    """
+    if not any("$" in i for i in keys):
+        return None
+    return tuple(i.replace("$", ".") if "$" in i else i for i in keys)
+
+
 class Timer:
+    __slots__ = ("start", "end")
+
     def __enter__(self):
-        self.start = time()
+        self.start = perf_counter_ns()
 
     def __exit__(self, exception_type, exception, traceback):
-        self.end = time()
-        print(f"Duration: {self.end - self.start}s")
+        self.end = perf_counter_ns()
+        print(f"Duration: {(self.end - self.start) / 1e9}s")
 
 
 class Query(t.Generic[TableInstance, QueryResponseType]):
-    __slots__ = ("table", "_frozen_querystrings")
+    __slots__ = ("table", "_frozen_querystrings", "_frozen_str")
+
+    # These are worked out once per subclass, rather than each time a query
+    # is run - see `__init_subclass__`.
+    _has_custom_response_handler: bool = False
+    _has_raw_response_callback: bool = False
 
     def __init__(
         self,
@@ -35,20 +59,28 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
     ):
         self.table = table
         self._frozen_querystrings = frozen_querystrings
+        self._frozen_str: t.Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._has_custom_response_handler = (
+            cls.response_handler is not Query.response_handler
+        )
+        cls._has_raw_response_callback = hasattr(cls, "_raw_response_callback")
 
     @property
     def engine_type(self) -> str:
-        engine = self.table._meta.db
-        if engine:
-            return engine.engine_type
-        else:
-            raise ValueError("Engine isn't defined.")
+        return self.table._meta.engine_type
 
     async def _process_results(self, results) -> QueryResponseType:
         if results:
-            keys = results[0].keys()
-            keys = [i.replace("$", ".") for i in keys]
-            if self.engine_type in ("postgres", "cockroach"):
+            keys = _translate_keys(tuple(results[0].keys()))
+            if keys is None:
+                # No keys need translating, so we can pass each row straight
+                # into dict - asyncpg's Record objects support this, and
+                # SQLite returns dictionaries anyway.
+                raw = [dict(i) for i in results]
+            elif self.engine_type in ("postgres", "cockroach"):
                 # asyncpg returns a special Record object. We can pass it
                 # directly into zip without calling `values` on it. This can
                 # save us hundreds of microseconds, depending on the number of
@@ -60,8 +92,8 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
         else:
             raw = []
 
-        if hasattr(self, "_raw_response_callback"):
-            self._raw_response_callback(raw)
+        if self._has_raw_response_callback:
+            self._raw_response_callback(raw)  # type: ignore
 
         output: t.Optional[OutputDelegate] = getattr(
             self, "output_delegate", None
@@ -112,7 +144,9 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
 
         #######################################################################
 
-        raw = await self.response_handler(raw)
+        # The default `response_handler` is a no-op, so avoid awaiting it.
+        if self._has_custom_response_handler:
+            raw = await self.response_handler(raw)
 
         if output:
             if output._output.as_objects:
@@ -123,11 +157,7 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
                     )
                 else:
                     return t.cast(
-                        QueryResponseType,
-                        [
-                            self.table(**columns, _exists_in_db=True)
-                            for columns in raw
-                        ],
+                        QueryResponseType, make_objects(raw, self.table)
                     )
 
         return t.cast(QueryResponseType, raw)
@@ -162,7 +192,9 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
             possible.
 
         """  # noqa: E501
-        self._validate()
+        # Frozen queries were validated when `freeze` was called.
+        if self._frozen_querystrings is None:
+            self._validate()
 
         engine = self.table._meta.db
 
@@ -236,6 +268,13 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
 
     ###########################################################################
 
+    # Maps each engine type to the property containing its querystrings.
+    _engine_querystrings: t.Dict[str, str] = {
+        "postgres": "postgres_querystrings",
+        "sqlite": "sqlite_querystrings",
+        "cockroach": "cockroach_querystrings",
+    }
+
     @property
     def sqlite_querystrings(self) -> t.Sequence[QueryString]:
         raise NotImplementedError
@@ -261,26 +300,17 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
             return self._frozen_querystrings
 
         engine_type = self.engine_type
-        if engine_type == "postgres":
-            try:
-                return self.postgres_querystrings
-            except NotImplementedError:
-                return self.default_querystrings
-        elif engine_type == "sqlite":
-            try:
-                return self.sqlite_querystrings
-            except NotImplementedError:
-                return self.default_querystrings
-        elif engine_type == "cockroach":
-            try:
-                return self.cockroach_querystrings
-            except NotImplementedError:
-                return self.default_querystrings
-        else:
+        attribute_name = self._engine_querystrings.get(engine_type)
+        if attribute_name is None:
             raise Exception(
                 f"No querystring found for the {engine_type} engine."
             )
 
+        try:
+            return getattr(self, attribute_name)
+        except NotImplementedError:
+            return self.default_querystrings
+
     ###########################################################################
 
     def freeze(self) -> FrozenQuery:
@@ -312,7 +342,8 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
         from scratch each time.
 
         Once a query is frozen, you can't apply any more clauses to it
-        (``where``, ``limit``, ``output`` etc).
+        (``where``, ``limit``, ``output`` etc). The query is validated when
+        it's frozen, rather than each time it's run.
 
         Even though ``freeze`` helps with performance, there are limits to
         how much it can help, as most of the time is still spent waiting for a
@@ -320,14 +351,20 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
         science scripts, it's a worthwhile optimisation.
 
         """
-        querystrings = self.querystrings
+        self._validate()
+
+        engine_type = self.engine_type
+        querystrings = tuple(self.querystrings)
         for querystring in querystrings:
-            querystring.freeze(engine_type=self.engine_type)
+            querystring.freeze(engine_type=engine_type)
 
         # Copy the query, so we don't store any references to the original.
         query = self.__class__(
             table=self.table, frozen_querystrings=querystrings
         )
+        # The query can no longer change, so the string representation can be
+        # cached too.
+        query._frozen_str = "; ".join(i.__str__() for i in querystrings)
 
         if hasattr(self, "limit_delegate"):
             # Needed for `response_handler`
@@ -342,6 +379,8 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
     ###########################################################################
 
     def __str__(self) -> str:
+        if self._frozen_str is not None:
+            return self._frozen_str
         return "; ".join([i.__str__() for i in self.querystrings])
 
 
@@ -349,14 +388,14 @@ class Query(t.Generic[TableInstance, QueryResponseType]):
 
 
 class FrozenQuery:
+    __slots__ = ("query", "run", "run_sync")
+
     def __init__(self, query: Query):
         self.query = query
-
-    async def run(self, *args, **kwargs):
-        return await self.query.run(*args, **kwargs)
-
-    def run_sync(self, *args, **kwargs):
-        return self.query.run_sync(*args, **kwargs)
+        # Frozen queries are intended to be run repeatedly, so rather than
+        # wrapping these methods, we call the underlying ones directly.
+        self.run = query.run
+        self.run_sync = query.run_sync
 
     def __getattr__(self, name: str):
         if hasattr(self.query, name):
@@ -382,11 +421,7 @@ class DDL:
 
     @property
     def engine_type(self) -> str:
-        engine = self.table._meta.db
-        if engine:
-            return engine.engine_type
-        else:
-            raise ValueError("Engine isn't defined.")
+        return self.table._meta.engine_type
 
     @property
     def sqlite_ddl(self) -> t.Sequence[str]:
@@ -445,13 +480,11 @@ class DDL:
                 "_meta"
             )
 
-        if len(self.ddl) == 1:
-            return await engine.run_ddl(self.ddl[0], in_pool=in_pool)
-        responses = []
-        for ddl in self.ddl:
-            response = await engine.run_ddl(ddl, in_pool=in_pool)
-            responses.append(response)
-        return responses
+        ddl = self.ddl
+
+        if len(ddl) == 1:
+            return await engine.run_ddl(ddl[0], in_pool=in_pool)
+        return await engine.run_ddls(ddl, in_pool=in_pool)
 
     def run_sync(self, timed=False, *args, **kwargs):
         """
@@ -326,7 +326,9 @@ class SelectList(Proxy["Select", t.List]):
             if len(rows[0].keys()) != 1:
                 raise ValueError("Each row returned more than one value")
 
-            response = list(itertools.chain(*[j.values() for j in rows]))
+            # Each row only has a single value, so we can flatten them in a
+            # single pass.
+            response = [value for row in rows for value in row.values()]
 
         modified_response = await self.query.callback_delegate.invoke(
             results=response, kind=CallbackType.success
@@ -441,7 +443,11 @@ class Select(Query[TableInstance, t.List[t.Dict[str, t.Any]]]):
         as_list: bool = False,
     ):
         row_ids = list(
-            set(itertools.chain(*[row[m2m_name] for row in response]))
+            set(
+                itertools.chain.from_iterable(
+                    row[m2m_name] for row in response
+                )
+            )
         )
         extra_rows = (
             (
@@ -88,6 +88,9 @@ class TableMeta:
     tags: t.List[str] = field(default_factory=list)
     help_text: t.Optional[str] = None
     _db: t.Optional[Engine] = None
+    _engine_type: t.Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     m2m_relationships: t.List[M2M] = field(default_factory=list)
     schema: t.Optional[str] = None
 
@@ -142,6 +145,17 @@ class TableMeta:
     @db.setter
     def db(self, value: Engine):
         self._db = value
+        self._engine_type = None
+
+    @property
+    def engine_type(self) -> str:
+        """
+        The ``engine_type`` of ``db`` - it's cached, as it's needed every time
+        a query is built.
+        """
+        if self._engine_type is None:
+            self._engine_type = self.db.engine_type
+        return self._engine_type
 
     def refresh_db(self):
         self.db = engine_finder()
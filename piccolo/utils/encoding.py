@@ -14,12 +14,14 @@ except ImportError:
 
 def dump_json(data: t.Any, pretty: bool = False) -> str:
     if ORJSON:
-        orjson_params: t.Dict[str, t.Any] = {"default": str}
-        if pretty:
-            orjson_params["option"] = (
-                orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE  # type: ignore
-            )
-        return orjson.dumps(data, **orjson_params).decode("utf8")
+        # orjson handles types like datetime and UUID natively - ``default``
+        # is only needed for the rest (e.g. Decimal).
+        option = (
+            orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE  # type: ignore
+            if pretty
+            else None
+        )
+        return orjson.dumps(data, default=str, option=option).decode("utf8")
     else:
         params: t.Dict[str, t.Any] = {"default": str}
         if pretty:
@@ -62,3 +62,64 @@ def make_nested_object(
     table_instance = table_class(**table_params)
     table_instance._exists_in_db = True
     return table_instance
+
+
+def _uses_table_init(table_class: t.Type[Table]) -> bool:
+    """
+    Returns ``True`` if ``table_class`` inherits ``__init__`` from ``Table``,
+    rather than overriding it (either directly, or via a mixin).
+
+    ``Table`` is the furthest base class which defines ``_meta``, so it can be
+    found without importing ``piccolo.table`` (which would be circular).
+    """
+    init_owner = next(
+        cls for cls in table_class.__mro__ if "__init__" in cls.__dict__
+    )
+    table_base = [
+        cls for cls in table_class.__mro__ if "_meta" in cls.__dict__
+    ][-1]
+    return init_owner is table_base
+
+
+def make_objects(
+    rows: t.Sequence[t.Dict[str, t.Any]], table_class: t.Type[Table]
+) -> t.List[Table]:
+    """
+    Converts each row returned by the database into a ``Table`` instance.
+
+    The mapping from the row's keys to the table's columns is only worked out
+    once, rather than for each row. If the rows contain exactly the table's
+    columns, and ``__init__`` hasn't been overridden, the values are assigned
+    directly, without going through ``__init__``.
+
+    """
+    if not rows:
+        return []
+
+    keys = rows[0].keys()
+    columns = table_class._meta.columns
+
+    attribute_names: t.List[t.Tuple[str, str]] = []
+
+    if len(keys) == len(columns) and _uses_table_init(table_class):
+        for column in columns:
+            name = column._meta.name
+            if name in keys:
+                attribute_names.append((name, name))
+            elif column._meta.db_column_name in keys:
+                attribute_names.append((name, column._meta.db_column_name))
+            else:
+                break
+        else:
+            instances = []
+            for row in rows:
+                # This needs to mirror what `Table.__init__` does.
+                instance = table_class.__new__(table_class)
+                instance._exists_in_db = True
+                instance._was_created = None
+                for name, key in attribute_names:
+                    instance[name] = row[key]
+                instances.append(instance)
+            return instances
+
+    return [table_class(**row, _exists_in_db=True) for row in rows]
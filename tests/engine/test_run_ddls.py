@@ -0,0 +1,49 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from piccolo.columns import Integer, Varchar
+from piccolo.engine.sqlite import SQLiteEngine
+from piccolo.table import Table
+from piccolo.utils.sync import run_sync
+from tests.base import sqlite_only
+
+
+class Musician(Table):
+    name = Varchar(index=True)
+    age = Integer(index=True)
+
+
+class TestRunDDLs(TestCase):
+    def tearDown(self):
+        Musician.alter().drop_table(if_exists=True).run_sync()
+
+    def test_run_ddls(self):
+        """
+        Make sure each DDL statement is run in order, and a response is
+        returned for each one.
+        """
+        ddls = Musician.create_table().ddl
+        self.assertGreater(len(ddls), 1)
+
+        responses = run_sync(Musician._meta.db.run_ddls(ddls, in_pool=False))
+
+        self.assertEqual(len(responses), len(ddls))
+        self.assertTrue(Musician.table_exists().run_sync())
+        indexes = Musician.indexes().run_sync()
+        self.assertIn(Musician._get_index_name(["name"]), indexes)
+        self.assertIn(Musician._get_index_name(["age"]), indexes)
+
+    @sqlite_only
+    def test_single_connection(self):
+        """
+        The statements should share a connection, rather than opening one for
+        each statement.
+        """
+        with patch.object(
+            SQLiteEngine,
+            "_run_in_new_connection",
+            side_effect=AssertionError("A new connection was opened"),
+        ):
+            Musician.create_table().run_sync()
+
+        self.assertTrue(Musician.table_exists().run_sync())
@@ -0,0 +1,76 @@
+import asyncio
+import typing as t
+
+from piccolo.engine.postgres import PostgresEngine
+from tests.base import DBTestCase, engines_only
+from tests.example_apps.music.tables import Manager
+
+
+@engines_only("postgres", "cockroach")
+class TestSharedConnection(DBTestCase):
+    async def _run_queries(self, use_pool: bool):
+        engine = t.cast(PostgresEngine, Manager._meta.db)
+
+        if use_pool:
+            await engine.start_connection_pool()
+
+        async with engine.shared_connection() as shared_connection:
+            self.assertIs(
+                engine.current_shared_connection.get(), shared_connection
+            )
+
+            await Manager(name="Bob").save()
+
+            # Nested blocks should reuse the existing connection.
+            async with engine.shared_connection() as nested_connection:
+                self.assertIs(nested_connection, shared_connection)
+
+            async with engine.transaction() as transaction:
+                self.assertIs(
+                    transaction.connection, shared_connection.connection
+                )
+                await Manager(name="Sally").save()
+
+            response = await Manager.select(Manager.name).order_by(
+                Manager.name
+            )
+
+        self.assertIsNone(engine.current_shared_connection.get())
+        self.assertEqual(response, [{"name": "Bob"}, {"name": "Sally"}])
+
+        if use_pool:
+            await engine.close_connection_pool()
+
+    def test_shared_connection(self):
+        """
+        Make sure queries can share a connection, with and without a
+        connection pool.
+        """
+        for use_pool in (False, True):
+            with self.subTest(use_pool=use_pool):
+                asyncio.run(self._run_queries(use_pool=use_pool))
+                Manager.delete(force=True).run_sync()
+
+    async def _run_concurrent_queries(self):
+        engine = t.cast(PostgresEngine, Manager._meta.db)
+        await engine.start_connection_pool()
+
+        async def run_query():
+            # Tasks started within the block mustn't use the shared
+            # connection, as it can only run one query at a time.
+            self.assertIsNone(engine.get_shared_connection())
+            return await Manager.select(Manager.name)
+
+        async with engine.shared_connection() as shared_connection:
+            self.assertIs(engine.get_shared_connection(), shared_connection)
+            await Manager(name="Bob").save()
+            responses = await asyncio.gather(run_query(), run_query())
+
+        await engine.close_connection_pool()
+        self.assertEqual(responses, [[{"name": "Bob"}], [{"name": "Bob"}]])
+
+    def test_gather(self):
+        """
+        Make sure queries can be run concurrently within the block.
+        """
+        asyncio.run(self._run_concurrent_queries())
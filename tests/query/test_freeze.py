@@ -5,6 +5,7 @@ from unittest import mock
 
 from piccolo.columns import Integer, Varchar
 from piccolo.query.base import FrozenQuery, Query
+from piccolo.query.methods.delete import DeletionError
 from piccolo.table import Table
 from tests.base import AsyncMock, DBTestCase, sqlite_only
 from tests.example_apps.music.tables import Band
@@ -126,3 +127,61 @@ class TestFreeze(DBTestCase):
 
         with self.assertRaises(AttributeError):
             query.where(Band.name == "Pythonistas")
+
+    def test_slots(self):
+        """
+        Make sure ``FrozenQuery`` uses slots, so new attributes can't be
+        assigned to it.
+        """
+        query = Band.select().freeze()
+
+        with self.assertRaises(AttributeError):
+            query.foo = "bar"  # type: ignore
+
+    def test_str(self):
+        """
+        Make sure the string representation of a frozen query matches the
+        original query.
+        """
+        query = Band.select(Band.name).where(Band.name == "Pythonistas")
+        self.assertEqual(query.freeze().__str__(), query.__str__())
+
+    def test_validation(self):
+        """
+        Frozen queries are validated when they're frozen, rather than when
+        they're run.
+        """
+        self.insert_rows()
+
+        query = Band.delete().where(Band.name == "Pythonistas").freeze()
+        query.run_sync()
+        self.assertEqual(Band.count().run_sync(), 2)
+
+        with self.assertRaises(DeletionError):
+            Band.delete().freeze()
+
+    def test_engine_reassigned(self):
+        """
+        A frozen query should use the table's current engine, even if it was
+        changed after the query was frozen.
+        """
+        db = mock.MagicMock()
+        db.engine_type = "sqlite"
+        db.run_querystring = AsyncMock()
+        db.run_querystring.return_value = [{"name": "Pythonistas"}]
+
+        class Band(Table, db=db):
+            name = Varchar()
+
+        frozen_query = Band.select(Band.name).freeze()
+
+        new_db = mock.MagicMock()
+        new_db.engine_type = "sqlite"
+        new_db.run_querystring = AsyncMock()
+        new_db.run_querystring.return_value = [{"name": "Rustaceans"}]
+        Band._meta.db = new_db
+
+        response = frozen_query.run_sync()
+        self.assertEqual(response, [{"name": "Rustaceans"}])
+        new_db.run_querystring.assert_called_once()
+        db.run_querystring.assert_not_called()
@@ -0,0 +1,39 @@
+import typing as t
+
+from piccolo.query.base import Query
+from piccolo.querystring import QueryString
+from tests.base import DBTestCase
+from tests.example_apps.music.tables import Manager
+
+
+class MultipleQuery(Query):
+    """
+    A query which is made up of several querystrings.
+    """
+
+    __slots__ = ("_querystrings",)
+
+    def __init__(self, table, querystrings: t.Sequence[QueryString]):
+        super().__init__(table=table)
+        self._querystrings = querystrings
+
+    @property
+    def default_querystrings(self) -> t.Sequence[QueryString]:
+        return self._querystrings
+
+
+class TestMultipleQuerystrings(DBTestCase):
+    def test_run(self):
+        """
+        Make sure each querystring is run in order, and a response is returned
+        for each one.
+        """
+        query = MultipleQuery(
+            table=Manager,
+            querystrings=[
+                QueryString("INSERT INTO manager (name) VALUES ('Guido')"),
+                QueryString("SELECT name FROM manager"),
+            ],
+        )
+        response = query.run_sync()
+        self.assertEqual(response, [[], [{"name": "Guido"}]])
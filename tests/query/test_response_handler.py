@@ -0,0 +1,28 @@
+import typing as t
+
+from piccolo.query.base import Query
+from piccolo.querystring import QueryString
+from tests.base import DBTestCase
+from tests.example_apps.music.tables import Band
+
+
+class CustomQuery(Query):
+    @property
+    def default_querystrings(self) -> t.Sequence[QueryString]:
+        return [QueryString("SELECT name FROM band")]
+
+    async def response_handler(self, response):
+        return [row["name"] for row in response]
+
+
+class TestResponseHandler(DBTestCase):
+    def test_custom_response_handler(self):
+        """
+        Make sure a custom ``response_handler`` is detected, and used.
+        """
+        self.assertFalse(Query._has_custom_response_handler)
+        self.assertTrue(CustomQuery._has_custom_response_handler)
+
+        self.insert_row()
+        response = CustomQuery(table=Band).run_sync()
+        self.assertEqual(response, ["Pythonistas"])
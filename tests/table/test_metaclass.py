@@ -153,3 +153,22 @@ class TestMetaClass(TestCase):
             pass
 
         self.assertTrue(hasattr(TableA, "id"))
+
+    def test_engine_type(self):
+        """
+        Make sure the engine type is cached, and updated if the engine
+        changes.
+        """
+        db = MagicMock()
+        db.engine_type = "postgres"
+
+        class TableA(Table, db=db):
+            pass
+
+        self.assertEqual(TableA._meta.engine_type, "postgres")
+
+        new_db = MagicMock()
+        new_db.engine_type = "sqlite"
+        TableA._meta.db = new_db
+
+        self.assertEqual(TableA._meta.engine_type, "sqlite")
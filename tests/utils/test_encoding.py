@@ -1,3 +1,5 @@
+import decimal
+import uuid
 from unittest import TestCase
 
 from piccolo.utils.encoding import dump_json, load_json
@@ -10,3 +12,17 @@ class TestEncodingDecoding(TestCase):
         """
         payload = {"a": [1, 2, 3]}
         self.assertEqual(load_json(dump_json(payload)), payload)
+
+    def test_dump_types(self):
+        """
+        Make sure types which aren't natively supported by JSON can still be
+        dumped.
+        """
+        payload = {
+            "id": uuid.UUID("5c7ebbbb-a1b4-4b1e-9d6c-5c3c5e7a3b1a"),
+            "price": decimal.Decimal("1.50"),
+        }
+        self.assertEqual(
+            load_json(dump_json(payload)),
+            {"id": "5c7ebbbb-a1b4-4b1e-9d6c-5c3c5e7a3b1a", "price": "1.50"},
+        )
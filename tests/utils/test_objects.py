@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+from piccolo.columns import Varchar
+from piccolo.table import Table
+from piccolo.utils.objects import make_objects
+from tests.example_apps.music.tables import Manager
+
+
+class TestMakeObjects(TestCase):
+    def test_make_objects(self):
+        """
+        Make sure each row is converted into a ``Table`` instance.
+        """
+        managers = make_objects(
+            [{"id": 1, "name": "Guido"}, {"id": 2, "name": "Graydon"}],
+            Manager,
+        )
+
+        self.assertEqual(
+            [(i.id, i.name) for i in managers],
+            [(1, "Guido"), (2, "Graydon")],
+        )
+        for manager in managers:
+            self.assertIsInstance(manager, Manager)
+            self.assertTrue(manager._exists_in_db)
+            self.assertIsNone(manager._was_created)
+
+    def test_custom_init(self):
+        """
+        If ``__init__`` has been overridden, it should still be called.
+        """
+
+        class MyTable(Table):
+            name = Varchar()
+
+            def __init__(self, **kwargs):
+                kwargs["name"] = kwargs["name"].upper()
+                super().__init__(**kwargs)
+
+        rows = make_objects([{"id": 1, "name": "guido"}], MyTable)
+        self.assertEqual(rows[0].name, "GUIDO")
+
+    def test_custom_init_mixin(self):
+        """
+        If ``__init__`` has been overridden by a mixin, it should still be
+        called.
+        """
+
+        class UpperMixin:
+            def __init__(self, **kwargs):
+                kwargs["name"] = kwargs["name"].upper()
+                super().__init__(**kwargs)
+
+        class MyTable(UpperMixin, Table):
+            name = Varchar()
+
+        rows = make_objects([{"id": 1, "name": "guido"}], MyTable)
+        self.assertEqual(rows[0].name, "GUIDO")
+
+    def test_custom_setitem(self):
+        """
+        If ``__setitem__`` has been overridden, it should be used to assign
+        the values.
+        """
+
+        class MyTable(Table):
+            name = Varchar()
+
+            def __setitem__(self, key, value):
+                if key == "name":
+                    value = value.upper()
+                super().__setitem__(key, value)
+
+        rows = make_objects([{"id": 1, "name": "guido"}], MyTable)
+        self.assertEqual(rows[0].name, "GUIDO")
+
+    def test_missing_columns(self):
+        """
+        If the rows don't contain every column, the defaults should be used.
+        """
+        rows = make_objects([{"name": "Guido"}], Manager)
+        self.assertEqual(rows[0].name, "Guido")
+        self.assertIsNotNone(rows[0].id)